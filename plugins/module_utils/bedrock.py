@@ -2,23 +2,21 @@
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 
 
-import time
-
-from ansible_collections.amazon.aws.plugins.module_utils.retries import AWSRetry
+from __future__ import annotations
 
-try:
-    import yaml
-except ImportError:
-    # Handled in module setup
-    pass
+import random
+import time
 
 try:
+    from botocore.config import Config
+    from botocore.exceptions import BotoCoreError
     from botocore.exceptions import ClientError
 except ImportError:
     pass
 
 from typing import Any
 from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import Tuple
@@ -82,17 +80,84 @@ def list_models_with_filters(module: AnsibleAWSModule, client) -> List[Dict[str,
 
 # Bedrock Agent Utilities
 
+# Agent options compared against, and sent as, the camelCase keys of the UpdateAgent API
+_AGENT_UPDATE_FIELDS: Dict[str, str] = {
+    "foundation_model": "foundationModel",
+    "instruction": "instruction",
+    "agent_resource_role_arn": "agentResourceRoleArn",
+    "orchestration_type": "orchestrationType",
+    "agent_collaboration": "agentCollaboration",
+}
+
 
-def wait_for_agent_status(client, module, agent_id: str, status: str, sleep_time: Optional[int] = 5) -> None:
+def get_bedrock_agent_client(module: AnsibleAWSModule, max_pool_connections: int = 10):
+    """
+    Create the bedrock-agent client shared by the Bedrock Agent modules.
+
+    Args:
+        module: The AnsibleAWSModule instance.
+        max_pool_connections: The size of the client's connection pool, raise it
+            when making concurrent calls.
+
+    Returns:
+        The boto3 Bedrock Agent client. Fails the module if it cannot be created.
+    """
+    # Let botocore retry throttled calls itself, the client-side rate limiting of the
+    # adaptive mode also applies to the status polling done while waiting on resources.
+    # This is the only retry layer, the helpers below are not wrapped in AWSRetry.
+    # TCP keep-alive stops the pooled connections being dropped during the longer waits.
+    config = Config(
+        retries={"mode": "adaptive", "max_attempts": 10},
+        tcp_keepalive=True,
+        max_pool_connections=max_pool_connections,
+    )
+    try:
+        return module.client("bedrock-agent", config=config)
+    except (ClientError, BotoCoreError) as e:
+        module.fail_json_aws(e, msg="Failed to connect to AWS.")
+
+
+def _poll_agent(
+    client, module, agent_id: str, status: str, delay: float = 0.5, max_delay: float = 15.0
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the details of a Bedrock Agent from successive `get_agent()` calls.
+
+    Between two calls the generator sleeps `delay` seconds, doubling the
+    interval each time up to `max_delay`. Once `wait_timeout` expires the
+    module is failed, `status` is only used to build that error message.
+    """
+    deadline = time.monotonic() + module.params.get("wait_timeout", 600)
+
+    while True:
+        agent = client.get_agent(agentId=agent_id)["agent"]
+        yield agent
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            module.fail_json(
+                msg=f"Timeout waiting for agent {agent_id} to reach status '{status}'. "
+                f"Last known status: '{agent['agentStatus']}'."
+            )
+
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, max_delay)
+
+
+def wait_for_agent_status(
+    client, module, agent_id: str, status: str, delay: float = 0.5, max_delay: float = 15.0
+) -> Optional[Dict[str, Any]]:
     """
     Wait for an Amazon Bedrock Agent to reach a specific status.
 
-    This function polls the Bedrock Agent at fixed intervals until it either
-    reaches the desired `status` or the configured timeout expires.
+    This function polls the Bedrock Agent with an exponential backoff until it
+    either reaches the desired `status` or the configured timeout expires.
 
     Behavior:
         - Uses `client.get_agent()` to retrieve the agent's current status.
-        - Waits `sleep_time` seconds between each polling attempt.
+        - Starts polling every `delay` seconds and doubles the interval after
+          each attempt, up to `max_delay` seconds, so that quick transitions
+          are detected without hammering the API on slow ones.
         - Stops early if the agent reaches the desired status or is deleted
           while waiting for the "DELETED" state.
         - Fails the Ansible module gracefully if the timeout expires.
@@ -104,42 +169,54 @@ def wait_for_agent_status(client, module, agent_id: str, status: str, sleep_time
         agent_id (str): The unique identifier of the Bedrock Agent to monitor.
         status (str): The target agent status to wait for
                       (e.g., "PREPARED", "DELETED").
-        sleep_time (int, optional): Number of seconds to sleep between polling
-                                    attempts. Defaults to 5 seconds.
+        delay (float, optional): Number of seconds to sleep after the first
+                                 polling attempt. Defaults to 0.5 seconds.
+        max_delay (float, optional): Upper bound for the sleep between polling
+                                     attempts. Defaults to 15 seconds.
+
+    Returns:
+        The agent details from the last poll, so callers do not need another
+        `get_agent()` call. None if the agent was deleted.
 
     Raises:
         ClientError: If AWS returns an unexpected error during polling.
-        TimeoutError: If the agent does not reach the target status before
-                      the timeout expires.
     """
-    wait_timeout = module.params.get("wait_timeout", 600)
-    max_attempts = max(1, wait_timeout // sleep_time)
+    try:
+        for agent in _poll_agent(client, module, agent_id, status, delay, max_delay):
+            if agent["agentStatus"] == status:
+                return agent
+    except ClientError as e:
+        if e.response["Error"]["Code"] == "ResourceNotFoundException" and status == "DELETED":
+            return None
+        raise
 
-    for attempt in range(max_attempts):
-        try:
-            current_status = client.get_agent(agentId=agent_id)["agent"]["agentStatus"]
 
-            if current_status == status:
-                return
+def _prepare_new_agent(client, module, agent_id: str) -> Dict[str, Any]:
+    """
+    Wait for a newly created Bedrock Agent to be created and prepare it.
 
-            time.sleep(sleep_time)
+    Both phases share a single polling loop: `prepare_agent()` is called as
+    soon as the agent is first reported as NOT_PREPARED, and polling carries
+    on with the same backoff until the agent is PREPARED.
 
-        except ClientError as e:
-            if e.response["Error"]["Code"] == "ResourceNotFoundException":
-                if status == "DELETED":
-                    return
-                raise
-            raise
+    Args:
+        client: A boto3 Bedrock Agent client instance.
+        module: The current Ansible module object.
+        agent_id (str): The unique identifier of the newly created agent.
 
-    # If we exit the loop without returning, timeout expired
-    module.fail_json(
-        msg=f"Timeout waiting for agent {agent_id} to reach status '{status}'. "
-        f"Last known status: '{current_status}'."
-    )
+    Returns:
+        The details of the prepared agent.
+    """
+    prepare_requested = False
+    for agent in _poll_agent(client, module, agent_id, "PREPARED"):
+        if agent["agentStatus"] == "PREPARED":
+            return agent
+        if agent["agentStatus"] == "NOT_PREPARED" and not prepare_requested:
+            client.prepare_agent(agentId=agent_id)
+            prepare_requested = True
 
 
-@AWSRetry.jittered_backoff(retries=10)
-def prepare_agent(client, module, agent_id: str) -> bool:
+def prepare_agent(client, module, agent_id: str) -> Dict[str, Any]:
     """
     Prepare a Bedrock Agent and wait until it reaches the 'PREPARED' state.
 
@@ -148,20 +225,16 @@ def prepare_agent(client, module, agent_id: str) -> bool:
         agent_id: The unique identifier of the Bedrock Agent.
 
     Returns:
-        True once the agent successfully reaches the 'PREPARED' state.
+        The details of the agent once it reaches the 'PREPARED' state.
 
     Behavior:
         - Calls the `prepare_agent()` API operation.
         - Waits using `wait_for_agent_status()` until the agent reports status 'PREPARED'.
-        - Retries automatically using the AWS jittered backoff decorator.
     """
     client.prepare_agent(agentId=agent_id)
-    wait_for_agent_status(client, module, agent_id, "PREPARED")
+    return wait_for_agent_status(client, module, agent_id, "PREPARED")
 
-    return True
 
-
-@AWSRetry.jittered_backoff(retries=10)
 def list_agents(client, **params: Any) -> List[Dict[str, Any]]:
     """
     Retrieve a list of Bedrock Agents using pagination.
@@ -177,7 +250,33 @@ def list_agents(client, **params: Any) -> List[Dict[str, Any]]:
     return paginator.paginate(**params).build_full_result()["agentSummaries"]
 
 
-@AWSRetry.jittered_backoff(retries=10)
+def _find_summary(
+    client, operation: str, result_key: str, name_key: str, name: str, **params: Any
+) -> Optional[Dict[str, Any]]:
+    """
+    Page through a Bedrock Agent list operation until a summary with the given name is found.
+
+    Args:
+        client: The boto3 Bedrock Agent client.
+        operation: The name of the paginated list operation (e.g. `list_agents`).
+        result_key: The key holding the summaries in each page.
+        name_key: The key holding the resource name in each summary.
+        name: The name to look for.
+        **params: Additional parameters for the paginator.
+
+    Returns:
+        The first matching summary dictionary, or None if there is no match.
+
+    Note:
+        Unlike `build_full_result()`, no further pages are requested once a match is found.
+    """
+    for page in client.get_paginator(operation).paginate(**params):
+        for summary in page.get(result_key, []):
+            if summary[name_key] == name:
+                return summary
+    return None
+
+
 def get_agent(client, agent_id: str) -> Optional[Dict[str, Any]]:
     """
     Retrieve details for a specific Bedrock Agent.
@@ -211,28 +310,25 @@ def find_agent(client, module) -> List[Dict[str, Any]]:
         List of agent detail dictionaries. Empty list if none are found.
 
     Behavior:
-        - Uses `list_agents()` to enumerate all agents.
-        - If `agent_name` is provided in module params, returns a list
-          containing only the matching agent (if found), or an empty list.
-        - If no name is given, returns detailed info for all agents.
+        - If `agent_name` is provided in module params, pages through the agents
+          until it is found and returns a list containing only the matching agent,
+          or an empty list.
+        - If no name is given, uses `list_agents()` to enumerate all agents and
+          returns detailed info for all of them.
     """
     agent_name: Optional[str] = module.params.get("agent_name")
 
-    agents_list: List[Dict[str, Any]] = list_agents(client)
-    if not agents_list:
-        return []
-
     if agent_name:
-        for agent_summary in agents_list:
-            if agent_summary["agentName"] == agent_name:
-                return [get_agent(client, agent_summary["agentId"])]
-        return []  # Empty list if no match found
-    else:
-        # Return a list of all agents with their detailed information
-        return [get_agent(client, agent["agentId"]) for agent in agents_list]
+        agent_summary = _find_summary(client, "list_agents", "agentSummaries", "agentName", agent_name)
+        if agent_summary is None:
+            return []  # Empty list if no match found
+        return [get_agent(client, agent_summary["agentId"])]
 
+    # Return a list of all agents with their detailed information
+    return [get_agent(client, agent["agentId"]) for agent in list_agents(client)]
 
-def create_agent(module: AnsibleAWSModule, client) -> Tuple[bool, Optional[str], str]:
+
+def create_agent(module: AnsibleAWSModule, client) -> Tuple[bool, Dict[str, Any], str]:
     """
     Creates a new agent if not in check_mode, otherwise simulates creation.
 
@@ -241,36 +337,71 @@ def create_agent(module: AnsibleAWSModule, client) -> Tuple[bool, Optional[str],
         client: boto3 bedrock-agent client.
 
     Returns:
-        (changed, agent_id, message)
+        (changed, agent, message), where agent holds the details of the prepared
+        agent, or is empty in check mode.
     """
     changed: bool = True
 
     if module.check_mode:
-        return changed, None, f"Check mode: would have created agent {module.params['agent_name']}."
+        return changed, {}, f"Check mode: would have created agent {module.params['agent_name']}."
 
+    # Build the API parameters directly, tags are passed through as given rather than camel-cased
+    fields = (("agent_name", "agentName"), ("tags", "tags"), *_AGENT_UPDATE_FIELDS.items())
     params: Dict[str, Any] = {
-        "agent_name": module.params["agent_name"],
-        "foundation_model": module.params["foundation_model"],
-        "instruction": module.params["instruction"],
-        "agent_resource_role_arn": module.params["agent_resource_role_arn"],
-        "orchestration_type": module.params["orchestration_type"],
-        "tags": module.params.get("tags"),
-        "agent_collaboration": module.params.get("agent_collaboration"),
-        "prompt_override_configuration": module.params.get("prompt_override_configuration"),
+        camel_key: value for field, camel_key in fields if (value := module.params.get(field)) is not None
     }
+    if module.params.get("prompt_override_configuration"):
+        params["promptOverrideConfiguration"] = snake_dict_to_camel_dict(
+            scrub_none_parameters(module.params["prompt_override_configuration"])
+        )
 
-    # Convert snake_case to camelCase for AWS API
-    camel_params = snake_dict_to_camel_dict(scrub_none_parameters(params))
-    new_agent = client.create_agent(**camel_params)
+    new_agent = client.create_agent(**params)
     agent_id: str = new_agent["agent"]["agentId"]
 
-    wait_for_agent_status(client, module, agent_id, "NOT_PREPARED")
-    prepare_agent(client, module, agent_id)
+    agent = _prepare_new_agent(client, module, agent_id)
 
-    return changed, agent_id, f"Agent {module.params['agent_name']} created successfully."
+    return changed, agent, f"Agent {module.params['agent_name']} created successfully."
 
 
-def update_agent(module: AnsibleAWSModule, client, existing_agent: Dict[str, Any]) -> Tuple[bool, Optional[str], str]:
+def _is_subset(wanted: Any, existing: Any) -> bool:
+    """
+    Check whether every key set in `wanted` has the same value in `existing`, recursing into dicts.
+    """
+    if isinstance(wanted, dict):
+        return isinstance(existing, dict) and all(
+            key in existing and _is_subset(value, existing[key]) for key, value in wanted.items()
+        )
+    return wanted == existing
+
+
+def _prompt_override_needs_update(wanted: Dict[str, Any], existing: Optional[Dict[str, Any]]) -> bool:
+    """
+    Compare a camelCase prompt override configuration against the one returned by `get_agent`.
+
+    Args:
+        wanted: The requested configuration, with unset suboptions removed.
+        existing: The agent's current `promptOverrideConfiguration`, if any.
+
+    Returns:
+        True if any requested setting differs from the agent's current configuration.
+
+    Note:
+        GetAgent returns a configuration for every prompt type, with defaults filled in,
+        so the requested prompt configurations are matched by `promptType` and only the
+        keys that were actually set are compared.
+    """
+    existing = existing or {}
+    if "overrideLambda" in wanted and wanted["overrideLambda"] != existing.get("overrideLambda"):
+        return True
+
+    existing_configs = {config.get("promptType"): config for config in existing.get("promptConfigurations", [])}
+    return not all(
+        _is_subset(config, existing_configs.get(config.get("promptType"), {}))
+        for config in wanted.get("promptConfigurations", [])
+    )
+
+
+def update_agent(module: AnsibleAWSModule, client, existing_agent: Dict[str, Any]) -> Tuple[bool, Dict[str, Any], str]:
     """
     Updates an existing agent if differences are detected.
 
@@ -280,7 +411,8 @@ def update_agent(module: AnsibleAWSModule, client, existing_agent: Dict[str, Any
         existing_agent: dict of existing agent details.
 
     Returns:
-        (changed, agent_id, message)
+        (changed, agent, message), where agent holds the details of the prepared
+        agent after an update, or existing_agent when nothing was sent.
     """
     existing_agent_id: str = existing_agent["agentId"]
     needs_update: Dict[str, Any] = {}
@@ -290,26 +422,22 @@ def update_agent(module: AnsibleAWSModule, client, existing_agent: Dict[str, Any
     if module.params.get("new_agent_name") and existing_agent["agentName"] != module.params["new_agent_name"]:
         needs_update["agentName"] = module.params["new_agent_name"]
 
-    # Generic fields to check and update
-    generic_fields = [
-        "foundation_model",
-        "instruction",
-        "agent_resource_role_arn",
-        "orchestration_type",
-        "agent_collaboration",
-    ]
-
-    for field in generic_fields:
-        value = module.params.get(field)
-        if value is not None:
-            # Convert snake_case to camelCase to match existing_agent keys
-            camel_key = snake_dict_to_camel_dict({field: None}).popitem()[0]
-            if existing_agent.get(camel_key) != value:
-                needs_update[field] = value
+    needs_update.update(
+        {
+            camel_key: value
+            for field, camel_key in _AGENT_UPDATE_FIELDS.items()
+            if (value := module.params.get(field)) is not None and existing_agent.get(camel_key) != value
+        }
+    )
 
     if module.params.get("prompt_override_configuration"):
-        dromedary_case_prompt_config = snake_dict_to_camel_dict(module.params["prompt_override_configuration"])
-        if existing_agent["promptOverrideConfiguration"] != dromedary_case_prompt_config:
+        # Unset suboptions come through as None and would never match the existing configuration
+        dromedary_case_prompt_config = snake_dict_to_camel_dict(
+            scrub_none_parameters(module.params["prompt_override_configuration"])
+        )
+        if _prompt_override_needs_update(
+            dromedary_case_prompt_config, existing_agent.get("promptOverrideConfiguration")
+        ):
             needs_update["promptOverrideConfiguration"] = dromedary_case_prompt_config
 
     if needs_update:
@@ -320,15 +448,15 @@ def update_agent(module: AnsibleAWSModule, client, existing_agent: Dict[str, Any
 
         changed = True
         if module.check_mode:
-            return True, existing_agent_id, f'Check mode: would have updated agent {existing_agent["agentName"]}.'
+            return True, existing_agent, f'Check mode: would have updated agent {existing_agent["agentName"]}.'
 
         needs_update["agentId"] = existing_agent_id
         client.update_agent(**needs_update)
-        prepare_agent(client, module, existing_agent_id)
+        agent = prepare_agent(client, module, existing_agent_id)
     else:
-        return changed, existing_agent_id, "No updates needed."
+        return changed, existing_agent, "No updates needed."
 
-    return changed, existing_agent_id, f"Agent {existing_agent['agentName']} updated successfully."
+    return changed, agent, f"Agent {existing_agent['agentName']} updated successfully."
 
 
 def delete_agent(module: AnsibleAWSModule, client, existing_agent: Dict[str, Any]) -> Tuple[bool, str]:
@@ -357,63 +485,76 @@ def delete_agent(module: AnsibleAWSModule, client, existing_agent: Dict[str, Any
 
 
 def wait_for_alias_status(
-    client, module, agent_id: str, alias_id: str, status: str, sleep_time: Optional[int] = 5
-) -> None:
+    client, module, agent_id: str, alias_id: str, status: str, delay: float = 0.5, max_delay: float = 8.0
+) -> Optional[Dict[str, Any]]:
     """
     Wait for an Amazon Bedrock Agent alias to reach a specific status.
 
-    This function polls a Bedrock Agent alias at fixed intervals until it
-    reaches the desired `status` or the timeout expires.
+    This function polls a Bedrock Agent alias with a jittered exponential
+    backoff until it reaches the desired `status` or the timeout expires.
 
     Behavior:
         - Uses `client.get_agent_alias()` to check the alias's current status.
-        - Waits `sleep_time` seconds between polling attempts.
+        - Starts polling every `delay` seconds and doubles the interval after
+          each attempt, up to `max_delay` seconds. Each sleep is drawn
+          uniformly between zero and that interval (full jitter) so concurrent
+          tasks do not poll in lockstep.
         - Stops early if the alias reaches the target status or if it's deleted
           while waiting for the "DELETED" state.
-        - Raises a TimeoutError if the desired status is not reached before
+        - Fails the Ansible module as soon as the alias reaches the "FAILED"
+          state, or the "DELETING" state unless waiting for "DELETED", or if
           the timeout expires.
 
     Args:
         client: A boto3 Bedrock Agent client instance.
+        module: The current Ansible module object, used for error reporting
+                and accessing parameters (specifically `wait_timeout`).
         agent_id (str): The ID of the parent Bedrock Agent.
         alias_id (str): The unique identifier of the alias to monitor.
         status (str): The target alias status to wait for
                       (e.g., "PREPARED", "DELETED").
-        sleep_time (int, optional): Number of seconds to sleep between polling
-                                    attempts. Defaults to 5 seconds.
+        delay (float, optional): Number of seconds to sleep after the first
+                                 polling attempt. Defaults to 0.5 seconds.
+        max_delay (float, optional): Upper bound for the sleep between polling
+                                     attempts. Defaults to 8 seconds.
+
+    Returns:
+        The alias details from the last poll, or None once the alias is deleted.
 
     Raises:
         ClientError: If AWS returns an unexpected error during polling.
-        TimeoutError: If the alias does not reach the target status within
-                      the timeout duration.
     """
-    wait_timeout = module.params.get("wait_timeout", 600)
-    max_attempts = max(1, wait_timeout // sleep_time)
+    deadline = time.monotonic() + module.params.get("wait_timeout", 600)
 
-    for attempt in range(max_attempts):
+    while True:
         try:
-            alias_info = client.get_agent_alias(agentId=agent_id, agentAliasId=alias_id)
-            current_status = alias_info["agentAlias"]["agentAliasStatus"]
-
-            if current_status == status:
-                return
-
-            time.sleep(sleep_time)
-
+            alias_info = client.get_agent_alias(agentId=agent_id, agentAliasId=alias_id)["agentAlias"]
         except ClientError as e:
-            if e.response["Error"]["Code"] == "ResourceNotFoundException":
-                if status == "DELETED":
-                    return
-                raise
+            if e.response["Error"]["Code"] == "ResourceNotFoundException" and status == "DELETED":
+                return None
             raise
 
-    raise TimeoutError(
-        f"Timeout waiting for alias {alias_id} (agent {agent_id}) to reach "
-        f"status '{status}'. Last known status: '{current_status}'."
-    )
+        current_status = alias_info["agentAliasStatus"]
+        if current_status == status:
+            return alias_info
+        if current_status == "FAILED" or (current_status == "DELETING" and status != "DELETED"):
+            module.fail_json(
+                msg=f"Alias {alias_id} (agent {agent_id}) reached status '{current_status}' "
+                f"while waiting for status '{status}'.",
+                failure_reasons=alias_info.get("failureReasons", []),
+            )
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            module.fail_json(
+                msg=f"Timeout waiting for alias {alias_id} (agent {agent_id}) to reach "
+                f"status '{status}'. Last known status: '{current_status}'."
+            )
+
+        time.sleep(min(random.uniform(0, delay), remaining))
+        delay = min(delay * 2, max_delay)
 
 
-@AWSRetry.jittered_backoff(retries=10)
 def get_agent_alias(client, agent_id: str, alias_id: str) -> Optional[Dict[str, Any]]:
     """
     Retrieve details for a specific alias of a Bedrock Agent.
@@ -431,7 +572,6 @@ def get_agent_alias(client, agent_id: str, alias_id: str) -> Optional[Dict[str,
 
     Behavior:
         - Uses the `get_agent_alias()` API to fetch alias metadata.
-        - Retries up to 10 times with exponential backoff using the `@AWSRetry.jittered_backoff` decorator.
         - Returns None if the alias does not exist (i.e., has been deleted or never created).
     """
     try:
@@ -441,7 +581,6 @@ def get_agent_alias(client, agent_id: str, alias_id: str) -> Optional[Dict[str,
             return None
 
 
-@AWSRetry.jittered_backoff(retries=10)
 def list_agent_aliases(client, **params: Any) -> List[Dict[str, Any]]:
     """
     Retrieve all aliases for a given Bedrock Agent.
@@ -467,16 +606,14 @@ def find_alias(client, agent_id: str, alias_name: str) -> Optional[Dict[str, Any
         alias_name: The name of the alias to search for.
 
     Returns:
-        The alias dictionary if found, otherwise None.
+        The alias summary dictionary if found, otherwise None.
     """
-    aliases: List[Dict[str, Any]] = list_agent_aliases(client, agentId=agent_id)
-    for alias in aliases:
-        if alias.get("agentAliasName") == alias_name:
-            return alias
-    return None
+    return _find_summary(
+        client, "list_agent_aliases", "agentAliasSummaries", "agentAliasName", alias_name, agentId=agent_id
+    )
 
 
-def create_alias(client, module: AnsibleAWSModule, agent_id: str) -> Tuple[bool, Optional[str], str]:
+def create_alias(client, module: AnsibleAWSModule, agent_id: str) -> Tuple[bool, Optional[Dict[str, Any]], str]:
     """
     Create a new alias for a Bedrock agent.
 
@@ -488,7 +625,7 @@ def create_alias(client, module: AnsibleAWSModule, agent_id: str) -> Tuple[bool,
     Returns:
         Tuple containing:
             - changed (bool): Whether the alias was created or would be created.
-            - alias_id (Optional[str]): The ID of the created alias (None in check mode).
+            - alias (Optional[Dict[str, Any]]): The details of the created alias (None in check mode).
             - msg (str): Human-readable message about the operation.
     """
     changed: bool = True
@@ -513,10 +650,10 @@ def create_alias(client, module: AnsibleAWSModule, agent_id: str) -> Tuple[bool,
     alias_info: Dict[str, Any] = response.get("agentAlias")
     alias_id = alias_info["agentAliasId"]
 
-    # Wait until alias reaches PREPARED state
-    wait_for_alias_status(client, module, agent_id, alias_id, "PREPARED")
+    # Wait until alias reaches PREPARED state, the last poll already holds the full alias
+    alias_info = wait_for_alias_status(client, module, agent_id, alias_id, "PREPARED")
 
-    return changed, alias_id, f"Agent alias {module.params['alias_name']} created successfully."
+    return changed, alias_info, f"Agent alias {module.params['alias_name']} created successfully."
 
 
 def delete_alias(
@@ -548,7 +685,6 @@ def delete_alias(
 # Bedrock Agent Action Group Utilities
 
 
-@AWSRetry.jittered_backoff(retries=10)
 def get_agent_action_group(client, agent_id: str, agent_version: str, action_group_id: str) -> Optional[Dict[str, Any]]:
     """
     Retrieve details for a specific action group associated with a Bedrock Agent.
@@ -571,7 +707,6 @@ def get_agent_action_group(client, agent_id: str, agent_version: str, action_gro
             return None
 
 
-@AWSRetry.jittered_backoff(retries=10)
 def list_agent_action_groups(client, **params: Any) -> List[Dict[str, Any]]:
     """
     Retrieve all action groups for a given Bedrock Agent.
@@ -587,7 +722,9 @@ def list_agent_action_groups(client, **params: Any) -> List[Dict[str, Any]]:
     return paginator.paginate(**params).build_full_result()["actionGroupSummaries"]
 
 
-def find_action_group(client, agent_id: str, action_group_name: str, agent_version: str) -> Optional[Dict[str, Any]]:
+def find_action_group(
+    client, agent_id: str, action_group_name: str, agent_version: str, full: bool = True
+) -> Optional[Dict[str, Any]]:
     """
     Find an existing action group by name.
 
@@ -596,16 +733,26 @@ def find_action_group(client, agent_id: str, action_group_name: str, agent_versi
         agent_id: The unique ID of the agent.
         action_group_name: The name of the action group to look for.
         agent_version: The version of the agent (e.g., "DRAFT").
+        full: Whether to describe the matching action group. When False, the
+            summary from the list call is returned instead, which is enough
+            to delete the action group.
 
     Returns:
-        The action group details as a dictionary if found, otherwise None.
-    """
-    action_groups = list_agent_action_groups(client, agentId=agent_id, agentVersion=agent_version)
-    for group in action_groups:
-        group_info = get_agent_action_group(client, agent_id, agent_version, group["actionGroupId"])
-        if group["actionGroupName"] == action_group_name:
-            return group_info
-    return None
+        The action group details (or summary) as a dictionary if found, otherwise None.
+    """
+    group = _find_summary(
+        client,
+        "list_agent_action_groups",
+        "actionGroupSummaries",
+        "actionGroupName",
+        action_group_name,
+        agentId=agent_id,
+        agentVersion=agent_version,
+    )
+    if group is None or not full:
+        return group
+    # Only describe the matching action group, the summary already holds the name
+    return get_agent_action_group(client, agent_id, agent_version, group["actionGroupId"])
 
 
 def create_action_group(client, module: AnsibleAWSModule, agent_id: str) -> Optional[Dict[str, Any]]:
@@ -642,6 +789,28 @@ def create_action_group(client, module: AnsibleAWSModule, agent_id: str) -> Opti
     return result, f"Action group '{module.params['action_group_name']}' created successfully."
 
 
+# Action group settings that have to be sent with every UpdateAgentActionGroup request
+_ACTION_GROUP_RESENT_FIELDS: Tuple[str, ...] = ("apiSchema", "actionGroupName", "actionGroupExecutor", "agentVersion")
+
+
+def _api_schema_changed(existing_payload: str, payload: str) -> bool:
+    """
+    Check whether two OpenAPI schema payloads describe different schemas.
+
+    Re-applying the same schema file is the common case, so the payloads are only
+    parsed when their text differs, formatting-only changes are then not an update.
+    """
+    if existing_payload == payload:
+        return False
+
+    # Only needed here, so only imported when an action group schema actually has to be parsed
+    import yaml
+
+    # Prefer the libyaml-backed loader, it parses large API schemas much faster than the pure Python one
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(existing_payload, Loader=loader) != yaml.load(payload, Loader=loader)
+
+
 def update_action_group(
     client, module: AnsibleAWSModule, existing_action_group: Dict[str, Any], agent_id: str
 ) -> Tuple[bool, Dict[str, Any]]:
@@ -666,15 +835,12 @@ def update_action_group(
     description: Optional[str] = module.params.get("description")
     agent_version: Optional[str] = module.params.get("agent_version")
 
-    current_api_schema_obj: Dict[str, Any] = yaml.safe_load(existing_action_group["apiSchema"]["payload"])
-    api_schema_obj: Dict[str, Any] = yaml.safe_load(api_schema)
-
     new_action_group_name: Optional[str] = module.params.get("new_action_group_name")
 
     update_obj: Dict[str, Any] = {}
     changed: bool = False
 
-    if current_api_schema_obj != api_schema_obj:
+    if _api_schema_changed(existing_action_group["apiSchema"]["payload"], api_schema):
         update_obj["apiSchema"] = {"payload": api_schema}
 
     if action_group_state != existing_action_group.get("actionGroupState"):
@@ -689,10 +855,8 @@ def update_action_group(
     if new_action_group_name and existing_action_group["actionGroupName"] != new_action_group_name:
         update_obj["actionGroupName"] = new_action_group_name
 
-    if (
-        existing_action_group.get("actionGroupExecutor", {}).get("lambda")
-        and existing_action_group.get("actionGroupExecutor", {}).get("lambda") != module.params["lambda_arn"]
-    ):
+    existing_lambda: Optional[str] = (existing_action_group.get("actionGroupExecutor") or {}).get("lambda")
+    if existing_lambda and existing_lambda != module.params["lambda_arn"]:
         update_obj["actionGroupExecutor"] = {"lambda": module.params["lambda_arn"]}
 
     if update_obj:
@@ -702,17 +866,9 @@ def update_action_group(
                 "actionGroupId": existing_action_group["actionGroupId"],
             }
         )
-        if update_obj.get("apiSchema") is None:
-            update_obj["apiSchema"] = existing_action_group["apiSchema"]
-
-        if update_obj.get("actionGroupName") is None:
-            update_obj["actionGroupName"] = existing_action_group["actionGroupName"]
-
-        if update_obj.get("actionGroupExecutor") is None:
-            update_obj["actionGroupExecutor"] = existing_action_group["actionGroupExecutor"]
-
-        if update_obj.get("agentVersion") is None:
-            update_obj["agentVersion"] = existing_action_group["agentVersion"]
+        # UpdateAgentActionGroup replaces the configuration, resend what is not being changed
+        for key in _ACTION_GROUP_RESENT_FIELDS:
+            update_obj.setdefault(key, existing_action_group[key])
 
         changed = True
         if module.check_mode:
@@ -734,7 +890,7 @@ def delete_action_group(client, module, agent_id: str, existing: dict) -> str:
         client: The boto3 Bedrock Agent client.
         module: The AnsibleAWSModule instance.
         agent_id: The unique ID of the agent.
-        existing: The existing action group dictionary to delete.
+        existing: The existing action group dictionary (or summary) to delete.
 
     Returns:
         str: A message describing the outcome of the operation.
@@ -743,6 +899,38 @@ def delete_action_group(client, module, agent_id: str, existing: dict) -> str:
         return f"Check mode: would have deleted action group {existing['actionGroupName']}."
 
     client.delete_agent_action_group(
-        agentId=agent_id, agentVersion=existing["agentVersion"], actionGroupId=existing["actionGroupId"]
+        agentId=agent_id, agentVersion=module.params["agent_version"], actionGroupId=existing["actionGroupId"]
     )
     return f"Action group {existing['actionGroupName']} deleted successfully."
+
+
+def action_group_to_snake_dict(action_group: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert an action group returned by AWS to snake_case for the module result.
+
+    The keys of each `functionSchema.functions[].parameters` map are parameter
+    names chosen by the user, so they are kept as they are. Everything else,
+    including the fields of each parameter, is converted as usual.
+
+    Args:
+        action_group: The action group dictionary (or summary) returned by AWS.
+
+    Returns:
+        The converted action group dictionary.
+    """
+    result = camel_dict_to_snake_dict(action_group, ignore_list=["tags", "functionSchema"])
+    function_schema = action_group.get("functionSchema")
+    if function_schema is None:
+        return result
+
+    result["function_schema"] = camel_dict_to_snake_dict(function_schema, ignore_list=["functions"])
+    if "functions" in function_schema:
+        result["function_schema"]["functions"] = []
+        for function in function_schema["functions"]:
+            converted = camel_dict_to_snake_dict(function, ignore_list=["parameters"])
+            if "parameters" in function:
+                converted["parameters"] = {
+                    name: camel_dict_to_snake_dict(details) for name, details in function["parameters"].items()
+                }
+            result["function_schema"]["functions"].append(converted)
+    return result
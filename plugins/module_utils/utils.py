@@ -3,10 +3,13 @@
 
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from datetime import datetime
 from typing import Any
+from typing import Callable
 from typing import Dict
+from typing import Iterable
 from typing import List
 from typing import Union
 
@@ -93,3 +96,29 @@ def convert_time_ranges(status_filter: Dict[str, Any]) -> Dict[str, Any]:
                 time_range_dict[time_key] = convert_time(time_range_dict[time_key], set_midnight)
 
     return status_filter
+
+
+def map_concurrently(func: Callable[[Any], Any], items: Iterable[Any], max_workers: int = 10) -> List[Any]:
+    """
+    Apply a function to every item using a bounded pool of threads.
+
+    Meant for independent, I/O-bound calls such as describing each resource
+    returned by a list API. boto3 clients are safe to share between threads.
+
+    Args:
+        func: The function to call with each item.
+        items: The items to process.
+        max_workers: The maximum number of concurrent calls, keep it within the
+            client's max_pool_connections.
+
+    Returns:
+        The results, in the same order as the items.
+
+    Raises:
+        Any exception raised by func, once the remaining calls have finished.
+    """
+    items = list(items)
+    if len(items) <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(func, items))
@@ -49,6 +49,7 @@ options:
         description:
             - The ARN of the IAM role for the agent.
             - Required when O(state=present).
+            - The value is checked to be an IAM role ARN before any API call is made.
         type: str
     agent_collaboration:
         description:
@@ -124,8 +125,8 @@ options:
               for the requested operation on the Bedrock Agent to complete before timing out.
             - This applies to operations that may take time to reach a stable state, such as
               creating, or updating an agent.
-            - During this period, the module will poll the agent's status at regular intervals
-              to detect when the operation has completed.
+            - During this period, the module will poll the agent's status to detect when the
+              operation has completed, starting with short intervals that grow up to 15 seconds.
             - If the agent does not reach the desired state within this timeout, the module
               will fail.
             - Increasing this value may be useful for slower or heavily loaded environments,
@@ -259,6 +260,7 @@ except ImportError:
     pass  # Handled by AnsibleAWSModule
 
 
+import re
 from typing import Any
 from typing import Dict
 from typing import List
@@ -267,101 +269,103 @@ from typing import Optional
 from ansible_collections.amazon.ai.plugins.module_utils.bedrock import create_agent
 from ansible_collections.amazon.ai.plugins.module_utils.bedrock import delete_agent
 from ansible_collections.amazon.ai.plugins.module_utils.bedrock import find_agent
-from ansible_collections.amazon.ai.plugins.module_utils.bedrock import get_agent
+from ansible_collections.amazon.ai.plugins.module_utils.bedrock import get_bedrock_agent_client
 from ansible_collections.amazon.ai.plugins.module_utils.bedrock import update_agent
 
 from ansible.module_utils.common.dict_transformations import camel_dict_to_snake_dict
 
 from ansible_collections.amazon.aws.plugins.module_utils.exceptions import AnsibleAWSError
 from ansible_collections.amazon.aws.plugins.module_utils.modules import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.retries import AWSRetry
 
+# Same pattern as the agentResourceRoleArn constraint of the Bedrock Agent API
+_ROLE_ARN_RE = re.compile(r"^arn:aws(-[^:]+)?:iam::([0-9]{12})?:role/.+$")
 
-def main():
-    argument_spec = dict(
-        state=dict(type="str", default="present", choices=["present", "absent"]),
-        agent_name=dict(type="str", required=True),
-        new_agent_name=dict(type="str"),
-        foundation_model=dict(type="str"),
-        instruction=dict(type="str"),
-        agent_resource_role_arn=dict(type="str"),
-        orchestration_type=dict(type="str", default="DEFAULT", choices=["DEFAULT", "CUSTOM_ORCHESTRATION"]),
-        tags=dict(type="dict", aliases=["resource_tags"]),
-        agent_collaboration=dict(type="str", choices=["SUPERVISOR", "SUPERVISOR_ROUTER", "DISABLED"]),
-        wait_timeout=dict(type="int", default=600, required=False),
-        prompt_override_configuration=dict(
-            type="dict",
-            options=dict(
-                prompt_configurations=dict(
-                    type="list",
-                    elements="dict",
-                    options=dict(
-                        prompt_type=dict(type="str"),
-                        base_prompt_template=dict(type="str"),
-                        inference_configuration=dict(
-                            type="dict",
-                            options=dict(
-                                maximum_length=dict(type="int"),
-                                temperature=dict(type="float"),
-                                top_k=dict(type="int"),
-                                top_p=dict(type="float"),
-                                stop_sequences=dict(type="list", elements="str"),
-                            ),
+_ARGUMENT_SPEC = dict(
+    state=dict(type="str", default="present", choices=["present", "absent"]),
+    agent_name=dict(type="str", required=True),
+    new_agent_name=dict(type="str"),
+    foundation_model=dict(type="str"),
+    instruction=dict(type="str"),
+    agent_resource_role_arn=dict(type="str"),
+    orchestration_type=dict(type="str", default="DEFAULT", choices=["DEFAULT", "CUSTOM_ORCHESTRATION"]),
+    tags=dict(type="dict", aliases=["resource_tags"]),
+    agent_collaboration=dict(type="str", choices=["SUPERVISOR", "SUPERVISOR_ROUTER", "DISABLED"]),
+    wait_timeout=dict(type="int", default=600, required=False),
+    prompt_override_configuration=dict(
+        type="dict",
+        options=dict(
+            prompt_configurations=dict(
+                type="list",
+                elements="dict",
+                options=dict(
+                    prompt_type=dict(type="str"),
+                    base_prompt_template=dict(type="str"),
+                    inference_configuration=dict(
+                        type="dict",
+                        options=dict(
+                            maximum_length=dict(type="int"),
+                            temperature=dict(type="float"),
+                            top_k=dict(type="int"),
+                            top_p=dict(type="float"),
+                            stop_sequences=dict(type="list", elements="str"),
                         ),
-                        parser_mode=dict(type="str"),
-                        prompt_creation_mode=dict(type="str"),
-                        prompt_state=dict(type="str"),
                     ),
+                    parser_mode=dict(type="str"),
+                    prompt_creation_mode=dict(type="str"),
+                    prompt_state=dict(type="str"),
                 ),
-                override_lambda=dict(type="str"),
             ),
+            override_lambda=dict(type="str"),
         ),
-    )
+    ),
+)
+
 
+def main():
     module = AnsibleAWSModule(
-        argument_spec=argument_spec,
+        argument_spec=_ARGUMENT_SPEC,
         supports_check_mode=True,
         required_if=[("state", "present", ["foundation_model", "instruction", "agent_resource_role_arn"])],
     )
 
     state: str = module.params["state"]
 
-    try:
-        client = module.client("bedrock-agent", retry_decorator=AWSRetry.jittered_backoff())
-    except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
-        module.fail_json_aws(e, msg="Failed to connect to AWS.")
+    # Reject a malformed role ARN before making any API calls, the role is not used when deleting
+    role_arn: Optional[str] = module.params.get("agent_resource_role_arn")
+    if state == "present" and role_arn and not _ROLE_ARN_RE.match(role_arn):
+        module.fail_json(msg=f"agent_resource_role_arn must be the ARN of an IAM role, got '{role_arn}'.")
 
-    changed: bool = False
-    result: Dict[str, Any] = dict(agent={})
-    agents: List[Dict[str, Any]] = find_agent(client, module)
-    existing_agent: Optional[Dict[str, Any]] = agents[0] if agents else None
+    client = get_bedrock_agent_client(module)
 
     try:
+        changed: bool = False
+        agent: Dict[str, Any] = {}
+        agents: List[Dict[str, Any]] = find_agent(client, module)
+        existing_agent: Optional[Dict[str, Any]] = agents[0] if agents else None
+
         if state == "present":
             if existing_agent:
                 # Update existing agent
-                changed, agent_id, msg = update_agent(module, client, existing_agent)
-                result["agent"] = get_agent(client, agent_id)
-                result["msg"] = msg
+                changed, agent, msg = update_agent(module, client, existing_agent)
             else:
                 # Create a new agent
-                changed, agent_id, msg = create_agent(module, client)
-                result["agent"] = get_agent(client, agent_id) if agent_id else {}
-                result["msg"] = msg
+                changed, agent, msg = create_agent(module, client)
 
         elif state == "absent":
             if existing_agent:
                 # Delete existing agent
                 changed, msg = delete_agent(module, client, existing_agent)
-                result["msg"] = msg
             else:
-                result["msg"] = "Agent does not exist."
-
-        module.exit_json(changed=changed, **camel_dict_to_snake_dict(result))
+                msg = "Agent does not exist."
 
+    except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
+        module.fail_json_aws(e, msg=f"Failed to manage agent {module.params['agent_name']}.")
     except AnsibleAWSError as e:
         module.fail_json_aws_error(e)
 
+    # Nothing to convert when the agent was deleted, or never existed.
+    module.exit_json(changed=changed, agent=camel_dict_to_snake_dict(agent) if agent else {}, msg=msg)
+
 
 if __name__ == "__main__":
     main()
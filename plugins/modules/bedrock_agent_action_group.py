@@ -61,6 +61,22 @@ options:
             - The OpenAPI schema.
             - Required when O(state=present).
         type: str
+    prepare_agent:
+        description:
+            - Whether to prepare the agent after the action group was changed.
+            - Preparing the agent waits for it to reach the C(PREPARED) status, set this to V(false)
+              when managing several action groups in a loop and only prepare on the last one.
+        type: bool
+        default: true
+        version_added: 2.0.0
+    prepare_unprepared_agent:
+        description:
+            - Whether to also prepare the agent when this task made no change but the agent has the C(NOT_PREPARED) status,
+              for example because earlier tasks were run with O(prepare_agent=false).
+            - Can only be used with O(state=present).
+        type: bool
+        default: false
+        version_added: 2.0.0
 extends_documentation_fragment:
     - amazon.ai.common.modules
     - amazon.ai.region.modules
@@ -144,59 +160,69 @@ EXAMPLES = r"""
     agent_name: "{{ agent_name }}"
     action_group_name: "{{ action_group_name }}"
     state: absent
-"""
 
+- name: Create several action groups, preparing the agent only once
+  amazon.ai.bedrock_agent_action_group:
+    agent_name: "{{ agent_name }}"
+    action_group_name: "{{ item.name }}"
+    lambda_arn: "{{ item.lambda_arn }}"
+    api_schema: "{{ lookup('file', item.api_schema) }}"
+    prepare_agent: "{{ ansible_loop.last }}"
+    prepare_unprepared_agent: "{{ ansible_loop.last }}"
+  loop: "{{ action_groups }}"
+  loop_control:
+    extended: true
+"""
 
-try:
-    import botocore
-except ImportError:
-    pass  # Handled by AnsibleAWSModule
 
-from ast import List
 from typing import Any
 from typing import Dict
+from typing import List
 from typing import Optional
 
+from ansible_collections.amazon.ai.plugins.module_utils.bedrock import action_group_to_snake_dict
 from ansible_collections.amazon.ai.plugins.module_utils.bedrock import create_action_group
 from ansible_collections.amazon.ai.plugins.module_utils.bedrock import delete_action_group
 from ansible_collections.amazon.ai.plugins.module_utils.bedrock import find_action_group
 from ansible_collections.amazon.ai.plugins.module_utils.bedrock import find_agent
-from ansible_collections.amazon.ai.plugins.module_utils.bedrock import get_agent_action_group
+from ansible_collections.amazon.ai.plugins.module_utils.bedrock import get_bedrock_agent_client
 from ansible_collections.amazon.ai.plugins.module_utils.bedrock import prepare_agent
 from ansible_collections.amazon.ai.plugins.module_utils.bedrock import update_action_group
 
-from ansible.module_utils.common.dict_transformations import camel_dict_to_snake_dict
-
 from ansible_collections.amazon.aws.plugins.module_utils.exceptions import AnsibleAWSError
 from ansible_collections.amazon.aws.plugins.module_utils.modules import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.retries import AWSRetry
 
+_ARGUMENT_SPEC = dict(
+    state=dict(type="str", default="present", choices=["present", "absent"]),
+    agent_name=dict(type="str", required=True),
+    action_group_name=dict(type="str", required=True),
+    agent_version=dict(type="str", default="DRAFT"),
+    new_action_group_name=dict(type="str"),
+    action_group_state=dict(type="str", choices=["ENABLED", "DISABLED"], default="ENABLED"),
+    description=dict(type="str"),
+    lambda_arn=dict(type="str"),
+    api_schema=dict(type="str"),
+    prepare_agent=dict(type="bool", default=True),
+    prepare_unprepared_agent=dict(type="bool", default=False),
+)
+
+_REQUIRED_IF = [("state", "present", ["lambda_arn", "api_schema"])]
 
-def main():
-    argument_spec = dict(
-        state=dict(type="str", default="present", choices=["present", "absent"]),
-        agent_name=dict(type="str", required=True),
-        action_group_name=dict(type="str", required=True),
-        agent_version=dict(type="str", default="DRAFT"),
-        new_action_group_name=dict(type="str"),
-        action_group_state=dict(type="str", choices=["ENABLED", "DISABLED"], default="ENABLED"),
-        description=dict(type="str"),
-        lambda_arn=dict(type="str"),
-        api_schema=dict(type="str"),
-    )
 
+def main():
     module = AnsibleAWSModule(
-        argument_spec=argument_spec,
+        argument_spec=_ARGUMENT_SPEC,
         supports_check_mode=True,
-        required_if=[("state", "present", ["lambda_arn", "api_schema"])],
+        required_if=_REQUIRED_IF,
     )
 
     agent_name: str = module.params["agent_name"]
+    state: str = module.params["state"]
 
-    try:
-        client = module.client("bedrock-agent", retry_decorator=AWSRetry.jittered_backoff())
-    except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
-        module.fail_json_aws(e, msg="Failed to connect to AWS.")
+    if module.params["prepare_unprepared_agent"] and state != "present":
+        module.fail_json(msg="prepare_unprepared_agent can only be used with state=present.")
+
+    client = get_bedrock_agent_client(module)
 
     # Get the agent ID from the provided name
     agents_list: List[Dict[str, Any]] = find_agent(client, module)
@@ -205,7 +231,6 @@ def main():
         module.fail_json(msg=f"Agent with name '{agent_name}' not found.")
     agent_id: str = agent.get("agentId")
 
-    state: str = module.params["state"]
     action_group_name: str = module.params["action_group_name"]
     agent_version: Optional[str] = module.params["agent_version"]
 
@@ -214,8 +239,9 @@ def main():
     result: Dict[str, Any] = {"action_group": {}}
 
     try:
+        # Deleting only needs the action group ID, which the list summary already holds
         found_action_group: Optional[Dict[str, Any]] = find_action_group(
-            client, agent_id, action_group_name, agent_version
+            client, agent_id, action_group_name, agent_version, full=state == "present"
         )
 
         if state == "present":
@@ -238,16 +264,17 @@ def main():
     except AnsibleAWSError as e:
         module.fail_json_aws_error(e)
 
-    # Conditionally prepare the agent after a change
-    if changed and not module.check_mode:
-        prepare_agent(client, module, agent_id)
+    # Conditionally prepare the agent after a change, or on request when earlier tasks left it unprepared
+    catch_up: bool = module.params["prepare_unprepared_agent"] and agent["agentStatus"] == "NOT_PREPARED"
+    if module.params["prepare_agent"] and (changed or catch_up):
+        changed = True
+        if not module.check_mode:
+            prepare_agent(client, module, agent_id)
 
     result["changed"] = changed
     if action_group_info:
-        action_group = get_agent_action_group(
-            client, agent_id, action_group_info["agentVersion"], action_group_info["actionGroupId"]
-        )
-        result["action_group"] = camel_dict_to_snake_dict(action_group)
+        # CreateAgentActionGroup and UpdateAgentActionGroup already return the full action group
+        result["action_group"] = action_group_to_snake_dict(action_group_info)
 
     module.exit_json(**result)
 
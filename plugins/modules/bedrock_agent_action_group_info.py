@@ -28,6 +28,21 @@ options:
         description:
             - The name of the action group to retrieve.
         type: str
+    details:
+        description:
+            - Whether to describe each action group to return its full configuration.
+            - When V(false), only the fields from the list of action groups are returned, which
+              avoids one API call per action group.
+        type: bool
+        default: true
+        version_added: 2.0.0
+    max_parallel_requests:
+        description:
+            - The maximum number of action groups to describe at the same time when listing all of them.
+            - The connection pool of the client is sized to match.
+        type: int
+        default: 10
+        version_added: 2.0.0
 extends_documentation_fragment:
     - amazon.ai.common.modules
     - amazon.ai.region.modules
@@ -43,6 +58,11 @@ EXAMPLES = r"""
 - name: List all action groups with full details
   amazon.ai.bedrock_agent_action_group_info:
     agent_name: "my_test_agent"
+
+- name: List the names and IDs of all action groups
+  amazon.ai.bedrock_agent_action_group_info:
+    agent_name: "my_test_agent"
+    details: false
 """
 
 
@@ -66,14 +86,17 @@ action_groups:
             sample: "ENABLED"
         agent_id:
             description: The unique identifier of the agent this action group belongs to.
+            returned: when O(details=true)
             type: str
             sample: "RNKFFDOKFN"
         agent_version:
             description: The version of the agent this action group is associated with.
+            returned: when O(details=true)
             type: str
             sample: "DRAFT"
         action_group_executor:
             description: Details about the action group's executor.
+            returned: when O(details=true)
             type: dict
             contains:
                 lambda:
@@ -82,6 +105,7 @@ action_groups:
                     sample: "arn:aws:lambda:us-east-1:123456789012:function:test-bedrock-lambda-test:12"
         api_schema:
             description: The OpenAPI 3.0 schema that defines the action group's API.
+            returned: when O(details=true)
             type: dict
             contains:
                 payload:
@@ -93,6 +117,7 @@ action_groups:
             sample: "Gets the current date and time."
         created_at:
             description: The timestamp when the action group was created.
+            returned: when O(details=true)
             type: str
             sample: "2025-10-03T14:33:09.676524+00:00"
         updated_at:
@@ -101,25 +126,21 @@ action_groups:
             sample: "2025-10-03T14:33:09.676524+00:00"
 """
 
-try:
-    import botocore
-except ImportError:
-    pass  # Handled by AnsibleAWSModule
-
 from typing import Any
 from typing import Dict
 from typing import List
 from typing import Optional
 
+from ansible_collections.amazon.ai.plugins.module_utils.bedrock import action_group_to_snake_dict
+from ansible_collections.amazon.ai.plugins.module_utils.bedrock import find_action_group
 from ansible_collections.amazon.ai.plugins.module_utils.bedrock import find_agent
 from ansible_collections.amazon.ai.plugins.module_utils.bedrock import get_agent_action_group
+from ansible_collections.amazon.ai.plugins.module_utils.bedrock import get_bedrock_agent_client
 from ansible_collections.amazon.ai.plugins.module_utils.bedrock import list_agent_action_groups
-
-from ansible.module_utils.common.dict_transformations import camel_dict_to_snake_dict
+from ansible_collections.amazon.ai.plugins.module_utils.utils import map_concurrently
 
 from ansible_collections.amazon.aws.plugins.module_utils.exceptions import AnsibleAWSError
 from ansible_collections.amazon.aws.plugins.module_utils.modules import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.retries import AWSRetry
 
 
 def main():
@@ -127,6 +148,8 @@ def main():
         agent_name=dict(type="str", required=True),
         agent_version=dict(type="str", default="DRAFT"),
         action_group_name=dict(type="str"),
+        details=dict(type="bool", default=True),
+        max_parallel_requests=dict(type="int", default=10),
     )
 
     module = AnsibleAWSModule(
@@ -137,11 +160,12 @@ def main():
     agent_name: str = module.params["agent_name"]
     agent_version: Optional[str] = module.params["agent_version"]
     action_group_name: Optional[str] = module.params.get("action_group_name")
+    max_parallel_requests: int = module.params["max_parallel_requests"]
 
-    try:
-        client = module.client("bedrock-agent", retry_decorator=AWSRetry.jittered_backoff())
-    except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
-        module.fail_json_aws(e, msg="Failed to connect to AWS.")
+    if max_parallel_requests < 1:
+        module.fail_json(msg="max_parallel_requests must be at least 1.")
+
+    client = get_bedrock_agent_client(module, max_pool_connections=max_parallel_requests)
 
     result: List[Dict[str, Any]] = []
     action_groups_details: List[Dict[str, Any]] = []
@@ -155,37 +179,35 @@ def main():
         agent_id: str = agent.get("agentId")
 
         if action_group_name:
-            # Find a specific action group by name
-            action_groups_summaries: List[Dict[str, Any]] = list_agent_action_groups(
-                client, agentId=agent_id, agentVersion=agent_version
+            # Find a specific action group by name, stopping at the page that holds it
+            found: Optional[Dict[str, Any]] = find_action_group(
+                client, agent_id, action_group_name, agent_version, full=module.params["details"]
             )
-            found_id: Optional[str] = None
-            for summary in action_groups_summaries:
-                if summary.get("actionGroupName") == action_group_name:
-                    found_id = summary.get("actionGroupId")
-                    break
-
-            if found_id:
-                details: Dict[str, Any] = get_agent_action_group(client, agent_id, agent_version, found_id)
-                result.append(details)
+            if found:
+                result.append(found)
         else:
-            # List all action groups and get full details for each
+            # List all action groups, with full details for each unless disabled
             action_groups_summaries: List[Dict[str, Any]] = list_agent_action_groups(
                 client, agentId=agent_id, agentVersion=agent_version
             )
-            for summary in action_groups_summaries:
-                details: Dict[str, Any] = get_agent_action_group(
-                    client, agent_id, agent_version, summary.get("actionGroupId")
+            if not module.params["details"]:
+                # The summaries hold everything that was asked for
+                result = action_groups_summaries
+            else:
+                # The describe calls are independent, run them concurrently rather than one after the other
+                action_groups_details = map_concurrently(
+                    lambda summary: get_agent_action_group(
+                        client, agent_id, agent_version, summary.get("actionGroupId")
+                    ),
+                    action_groups_summaries,
+                    max_workers=max_parallel_requests,
                 )
-                action_groups_details.append(details)
-            result = action_groups_details
+                result = action_groups_details
 
     except AnsibleAWSError as e:
         module.fail_json_aws_error(e)
 
-    module.exit_json(
-        action_groups=[camel_dict_to_snake_dict(action_group, ignore_list=["tags"]) for action_group in result]
-    )
+    module.exit_json(action_groups=[action_group_to_snake_dict(action_group) for action_group in result])
 
 
 if __name__ == "__main__":
@@ -62,7 +62,10 @@ extends_documentation_fragment:
 
 RETURN = r"""
 agent_alias:
-    description: A dictionary containing the detailed configuration of an agent alias.
+    description:
+      - A dictionary containing the detailed configuration of an agent alias.
+      - When O(state=absent), the summary of the deleted alias, which does not include
+        RV(agent_alias.agent_alias_arn), RV(agent_alias.agent_id) and RV(agent_alias.agent_alias_history_events).
     type: dict
     returned: always
     contains:
@@ -169,11 +172,6 @@ EXAMPLES = r"""
 """
 
 
-try:
-    import botocore
-except ImportError:
-    pass  # Handled by AnsibleAWSModule
-
 from typing import Any
 from typing import Dict
 from typing import List
@@ -184,33 +182,33 @@ from ansible_collections.amazon.ai.plugins.module_utils.bedrock import delete_al
 from ansible_collections.amazon.ai.plugins.module_utils.bedrock import find_agent
 from ansible_collections.amazon.ai.plugins.module_utils.bedrock import find_alias
 from ansible_collections.amazon.ai.plugins.module_utils.bedrock import get_agent_alias
+from ansible_collections.amazon.ai.plugins.module_utils.bedrock import get_bedrock_agent_client
 
 from ansible.module_utils.common.dict_transformations import camel_dict_to_snake_dict
 
 from ansible_collections.amazon.aws.plugins.module_utils.exceptions import AnsibleAWSError
 from ansible_collections.amazon.aws.plugins.module_utils.modules import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.retries import AWSRetry
 
-
-def main():
-    argument_spec = dict(
-        state=dict(type="str", default="present", choices=["present", "absent"]),
-        agent_name=dict(type="str", required=True),
-        alias_name=dict(type="str", required=True),
-        tags=dict(type="dict", aliases=["resource_tags"]),
-        description=dict(type="str"),
-        routing_configuration=dict(
-            type="list",
-            elements="dict",
-            options=dict(
-                agent_version=dict(type="str"),
-                provisioned_throughput=dict(type="str"),
-            ),
+_ARGUMENT_SPEC = dict(
+    state=dict(type="str", default="present", choices=["present", "absent"]),
+    agent_name=dict(type="str", required=True),
+    alias_name=dict(type="str", required=True),
+    tags=dict(type="dict", aliases=["resource_tags"]),
+    description=dict(type="str"),
+    routing_configuration=dict(
+        type="list",
+        elements="dict",
+        options=dict(
+            agent_version=dict(type="str"),
+            provisioned_throughput=dict(type="str"),
         ),
-    )
+    ),
+)
+
 
+def main():
     module = AnsibleAWSModule(
-        argument_spec=argument_spec,
+        argument_spec=_ARGUMENT_SPEC,
         supports_check_mode=True,
     )
 
@@ -218,10 +216,7 @@ def main():
     agent_name: str = module.params["agent_name"]
     alias_name: str = module.params["alias_name"]
 
-    try:
-        client = module.client("bedrock-agent", retry_decorator=AWSRetry.jittered_backoff())
-    except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
-        module.fail_json_aws(e, msg="Failed to connect to AWS.")
+    client = get_bedrock_agent_client(module)
 
     changed: bool = False
     result: Dict[str, Any] = {"agent_alias": {}}
@@ -238,8 +233,8 @@ def main():
 
         if state == "present":
             if found_alias is None:
-                changed, alias_id, msg = create_alias(client, module, agent_id)
-                result["agent_alias"] = get_agent_alias(client, agent_id, alias_id) if alias_id else {}
+                changed, alias_info, msg = create_alias(client, module, agent_id)
+                result["agent_alias"] = alias_info or {}
                 result["msg"] = msg
                 changed = True
 
@@ -247,11 +242,13 @@ def main():
                 result[
                     "msg"
                 ] = f"An agent alias with name {found_alias['agentAliasName']} exists and can not be updated."
+                # The summary lacks the ARN, agent ID and history events, so describe the alias
                 result["agent_alias"] = get_agent_alias(client, agent_id, found_alias["agentAliasId"])
 
         elif state == "absent":
             if found_alias is not None:
                 changed, agent_id, msg = delete_alias(client, module, agent_id, found_alias)
+                result["agent_alias"] = found_alias
                 result["msg"] = msg
             else:
                 result["msg"] = "Agent alias does not exist."
@@ -130,44 +130,38 @@ agent_aliases:
 """
 
 
-try:
-    import botocore
-except ImportError:
-    pass  # Handled by AnsibleAWSModule
-
 from typing import Any
 from typing import Dict
 from typing import List
 from typing import Optional
 
 from ansible_collections.amazon.ai.plugins.module_utils.bedrock import find_agent
+from ansible_collections.amazon.ai.plugins.module_utils.bedrock import find_alias
 from ansible_collections.amazon.ai.plugins.module_utils.bedrock import get_agent_alias
+from ansible_collections.amazon.ai.plugins.module_utils.bedrock import get_bedrock_agent_client
 from ansible_collections.amazon.ai.plugins.module_utils.bedrock import list_agent_aliases
+from ansible_collections.amazon.ai.plugins.module_utils.utils import map_concurrently
 
 from ansible.module_utils.common.dict_transformations import camel_dict_to_snake_dict
 
 from ansible_collections.amazon.aws.plugins.module_utils.exceptions import AnsibleAWSError
 from ansible_collections.amazon.aws.plugins.module_utils.modules import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.retries import AWSRetry
 
+_ARGUMENT_SPEC = dict(
+    agent_name=dict(type="str", required=True),
+    alias_name=dict(type="str"),
+)
 
-def main():
-    argument_spec = dict(
-        agent_name=dict(type="str", required=True),
-        alias_name=dict(type="str"),
-    )
 
+def main():
     module = AnsibleAWSModule(
-        argument_spec=argument_spec,
+        argument_spec=_ARGUMENT_SPEC,
         supports_check_mode=True,
     )
 
     agent_name: str = module.params["agent_name"]
 
-    try:
-        client = module.client("bedrock-agent", retry_decorator=AWSRetry.jittered_backoff())
-    except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
-        module.fail_json_aws(e, msg="Failed to connect to AWS.")
+    client = get_bedrock_agent_client(module)
 
     result: List[Dict[str, Any]] = []
 
@@ -180,18 +174,18 @@ def main():
 
         agent_id: str = agent.get("agentId")
 
-        # List aliases using the found agent ID
-        aliases_summary: List[Dict[str, Any]] = list_agent_aliases(client, agentId=agent_id)
-
         if module.params.get("alias_name"):
-            found_alias = next(
-                (alias for alias in aliases_summary if alias["agentAliasName"] == module.params["alias_name"]), None
-            )
+            found_alias = find_alias(client, agent_id, module.params["alias_name"])
             if found_alias:
                 result.append(get_agent_alias(client, agent_id, found_alias.get("agentAliasId")))
         else:
-            for alias in aliases_summary:
-                result.append(get_agent_alias(client, agent_id, alias.get("agentAliasId")))
+            # List aliases using the found agent ID
+            aliases_summary: List[Dict[str, Any]] = list_agent_aliases(client, agentId=agent_id)
+
+            # The describe calls are independent, run them concurrently rather than one after the other
+            result = map_concurrently(
+                lambda alias: get_agent_alias(client, agent_id, alias.get("agentAliasId")), aliases_summary
+            )
 
     except AnsibleAWSError as e:
         module.fail_json_aws_error(e)
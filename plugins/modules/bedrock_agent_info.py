@@ -150,17 +150,13 @@ agents:
 """
 
 
-try:
-    import botocore
-except ImportError:
-    pass  # Handled by AnsibleAWSModule
-
 from typing import Any
 from typing import Dict
 from typing import List
 from typing import Optional
 
 from ansible_collections.amazon.ai.plugins.module_utils.bedrock import find_agent
+from ansible_collections.amazon.ai.plugins.module_utils.bedrock import get_bedrock_agent_client
 from ansible_collections.amazon.ai.plugins.module_utils.bedrock import list_agent_action_groups
 from ansible_collections.amazon.ai.plugins.module_utils.bedrock import list_agent_aliases
 
@@ -168,7 +164,6 @@ from ansible.module_utils.common.dict_transformations import camel_dict_to_snake
 
 from ansible_collections.amazon.aws.plugins.module_utils.exceptions import AnsibleAWSError
 from ansible_collections.amazon.aws.plugins.module_utils.modules import AnsibleAWSModule
-from ansible_collections.amazon.aws.plugins.module_utils.retries import AWSRetry
 
 
 def _add_related_info(client, module: AnsibleAWSModule, agent_info: Dict[str, Any]) -> Dict[str, Any]:
@@ -214,10 +209,7 @@ def main():
 
     agent_name: Optional[str] = module.params.get("agent_name")
 
-    try:
-        client = module.client("bedrock-agent", retry_decorator=AWSRetry.jittered_backoff())
-    except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
-        module.fail_json_aws(e, msg="Failed to connect to AWS.")
+    client = get_bedrock_agent_client(module)
 
     result: List[Dict[str, Any]] = []
 
@@ -49,6 +49,16 @@ options:
             - A dictionary containing session state information, such as conversation history or attributes.
             - This maps directly to the sessionState parameter in the InvokeAgent API.
         type: dict
+    performance_config_latency:
+        description:
+            - Model performance settings for the agent's foundation model, optimizing for latency.
+            - Latency-optimized inference is only available for some models and regions.
+            - This option requires a botocore release that supports the C(bedrockModelConfigurations)
+              parameter of the InvokeAgent API, it is ignored with a warning otherwise.
+        type: str
+        choices: ['standard', 'optimized']
+        default: 'standard'
+        version_added: 2.0.0
 extends_documentation_fragment:
     - amazon.ai.common.modules
     - amazon.ai.region.modules
@@ -122,6 +132,7 @@ def main():
         end_session=dict(type="bool", default=False),
         enable_trace=dict(type="bool", default=False),
         session_state=dict(type="dict"),
+        performance_config_latency=dict(type="str", choices=["standard", "optimized"], default="standard"),
     )
 
     module = AnsibleAWSModule(argument_spec=argument_spec, supports_check_mode=True)
@@ -152,6 +163,17 @@ def main():
             }
             if module.params.get("session_state"):
                 params["sessionState"] = module.params["session_state"]
+            if module.params["performance_config_latency"] != "standard":
+                invoke_agent_input = client.meta.service_model.operation_model("InvokeAgent").input_shape
+                if "bedrockModelConfigurations" not in invoke_agent_input.members:
+                    module.warn(
+                        "performance_config_latency is not supported by this botocore version."
+                        " performance_config_latency will be ignored."
+                    )
+                else:
+                    params["bedrockModelConfigurations"] = {
+                        "performanceConfig": {"latency": module.params["performance_config_latency"]}
+                    }
 
             response: Dict[str, Any] = client.invoke_agent(aws_retry=True, **params)
             for event in response.get("completion", []):
@@ -0,0 +1,550 @@
+# Copyright: Contributors to the Ansible project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+from unittest.mock import MagicMock
+
+import pytest
+import yaml
+from ansible_collections.amazon.ai.plugins.module_utils import bedrock
+from ansible_collections.amazon.ai.plugins.module_utils.bedrock import action_group_to_snake_dict
+from ansible_collections.amazon.ai.plugins.module_utils.bedrock import create_agent
+from ansible_collections.amazon.ai.plugins.module_utils.bedrock import create_alias
+from ansible_collections.amazon.ai.plugins.module_utils.bedrock import find_action_group
+from ansible_collections.amazon.ai.plugins.module_utils.bedrock import find_agent
+from ansible_collections.amazon.ai.plugins.module_utils.bedrock import find_alias
+from ansible_collections.amazon.ai.plugins.module_utils.bedrock import get_bedrock_agent_client
+from ansible_collections.amazon.ai.plugins.module_utils.bedrock import update_action_group
+from ansible_collections.amazon.ai.plugins.module_utils.bedrock import update_agent
+from ansible_collections.amazon.ai.plugins.module_utils.bedrock import wait_for_agent_status
+from ansible_collections.amazon.ai.plugins.module_utils.bedrock import wait_for_alias_status
+
+EXISTING_AGENT = {
+    "agentId": "RNKFFDOKFN",
+    "agentName": "test-agent",
+    "agentStatus": "PREPARED",
+    "foundationModel": "amazon.nova-micro-v1:0",
+    "instruction": "You are a friendly chat bot.",
+    "agentResourceRoleArn": "arn:aws:iam::123456789012:role/BedrockAgentRole",
+    "orchestrationType": "DEFAULT",
+    "promptOverrideConfiguration": {
+        "promptConfigurations": [
+            {
+                "promptType": "ORCHESTRATION",
+                "basePromptTemplate": "template",
+                "promptCreationMode": "OVERRIDDEN",
+            }
+        ]
+    },
+}
+
+EXISTING_ACTION_GROUP = {
+    "actionGroupId": "ABCDEFGHIJ",
+    "actionGroupName": "test-action-group",
+    "actionGroupState": "ENABLED",
+    "agentVersion": "DRAFT",
+    "actionGroupExecutor": {"lambda": "arn:aws:lambda:us-east-1:123456789012:function:test"},
+    "apiSchema": {"payload": '{"openapi": "3.0.0", "paths": {"/hello": {"get": {"operationId": "hello"}}}}'},
+}
+
+
+def _agent_module(check_mode=False, **params):
+    module = MagicMock()
+    module.check_mode = check_mode
+    module.params = {
+        "agent_name": "test-agent",
+        "new_agent_name": None,
+        "foundation_model": "amazon.nova-micro-v1:0",
+        "instruction": "You are a friendly chat bot.",
+        "agent_resource_role_arn": "arn:aws:iam::123456789012:role/BedrockAgentRole",
+        "orchestration_type": "DEFAULT",
+        "agent_collaboration": None,
+        "prompt_override_configuration": None,
+        "wait_timeout": 600,
+    }
+    module.params.update(params)
+    return module
+
+
+def _action_group_module(check_mode=False, **params):
+    module = MagicMock()
+    module.check_mode = check_mode
+    module.params = {
+        "action_group_name": "test-action-group",
+        "new_action_group_name": None,
+        "description": None,
+        "agent_version": "DRAFT",
+        "action_group_state": "ENABLED",
+        "lambda_arn": "arn:aws:lambda:us-east-1:123456789012:function:test",
+        "api_schema": "openapi: 3.0.0\npaths:\n  /hello:\n    get:\n      operationId: hello\n",
+    }
+    module.params.update(params)
+    return module
+
+
+class FakeClock:
+    """Stands in for time.monotonic/time.sleep so the waiters run instantly."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture(name="clock")
+def fixture_clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(bedrock.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(bedrock.time, "sleep", fake.sleep)
+    return fake
+
+
+# ----------------------------------
+# Tests for get_bedrock_agent_client
+# ----------------------------------
+def test_get_bedrock_agent_client():
+    module = MagicMock()
+
+    assert get_bedrock_agent_client(module, max_pool_connections=16) is module.client.return_value
+
+    config = module.client.call_args.kwargs["config"]
+    module.client.assert_called_once_with("bedrock-agent", config=config)
+    assert config.retries == {"mode": "adaptive", "max_attempts": 10}
+    assert config.tcp_keepalive is True
+    assert config.max_pool_connections == 16
+
+
+# -------------------------------
+# Tests for wait_for_agent_status
+# -------------------------------
+def test_wait_for_agent_status_backoff(clock):
+    client = MagicMock()
+    client.get_agent.side_effect = [{"agent": {"agentStatus": s}} for s in ("CREATING", "CREATING", "PREPARED")]
+    module = _agent_module()
+
+    agent = wait_for_agent_status(client, module, "RNKFFDOKFN", "PREPARED")
+
+    assert agent == {"agentStatus": "PREPARED"}
+    assert client.get_agent.call_count == 3
+    assert clock.sleeps == [0.5, 1.0]
+    module.fail_json.assert_not_called()
+
+
+def test_wait_for_agent_status_timeout(clock):
+    client = MagicMock()
+    client.get_agent.return_value = {"agent": {"agentStatus": "PREPARING"}}
+    module = _agent_module(wait_timeout=60)
+    module.fail_json.side_effect = SystemExit
+
+    with pytest.raises(SystemExit):
+        wait_for_agent_status(client, module, "RNKFFDOKFN", "PREPARED")
+
+    assert clock.now == 60
+    assert max(clock.sleeps) == 15.0
+    assert "Last known status: 'PREPARING'" in module.fail_json.call_args.kwargs["msg"]
+
+
+# -------------------------------
+# Tests for wait_for_alias_status
+# -------------------------------
+def test_wait_for_alias_status_jittered_backoff(clock, monkeypatch):
+    monkeypatch.setattr(bedrock.random, "uniform", lambda low, high: high)
+    client = MagicMock()
+    client.get_agent_alias.return_value = {"agentAlias": {"agentAliasStatus": "CREATING"}}
+    module = _agent_module(wait_timeout=60)
+    module.fail_json.side_effect = SystemExit
+
+    with pytest.raises(SystemExit):
+        wait_for_alias_status(client, module, "RNKFFDOKFN", "Q8U5JCV5WI", "PREPARED")
+
+    assert clock.sleeps[:5] == [0.5, 1.0, 2.0, 4.0, 8.0]
+    assert max(clock.sleeps) == 8.0
+    assert clock.now == 60
+    assert "Last known status: 'CREATING'" in module.fail_json.call_args.kwargs["msg"]
+
+
+@pytest.mark.parametrize("terminal_status", ["FAILED", "DELETING"])
+def test_wait_for_alias_status_terminal(clock, terminal_status):
+    client = MagicMock()
+    client.get_agent_alias.side_effect = [
+        {"agentAlias": {"agentAliasStatus": "CREATING"}},
+        {"agentAlias": {"agentAliasStatus": terminal_status, "failureReasons": ["Agent version not found."]}},
+    ]
+    module = _agent_module()
+    module.fail_json.side_effect = SystemExit
+
+    with pytest.raises(SystemExit):
+        wait_for_alias_status(client, module, "RNKFFDOKFN", "Q8U5JCV5WI", "PREPARED")
+
+    assert client.get_agent_alias.call_count == 2
+    assert f"reached status '{terminal_status}'" in module.fail_json.call_args.kwargs["msg"]
+    assert module.fail_json.call_args.kwargs["failure_reasons"] == ["Agent version not found."]
+
+
+# --------------------
+# Tests for find_agent
+# --------------------
+def _paginated_agents(*pages):
+    client = MagicMock()
+    client.get_paginator.return_value.paginate.return_value = iter(
+        {"agentSummaries": [{"agentId": name.upper(), "agentName": name} for name in page]} for page in pages
+    )
+    client.get_agent.side_effect = lambda agentId: {"agent": {"agentId": agentId}}
+    return client
+
+
+def test_find_agent_stops_paging_on_match():
+    client = _paginated_agents(["agent-a", "agent-b"], ["test-agent"], ["agent-c"])
+
+    assert find_agent(client, _agent_module()) == [{"agentId": "TEST-AGENT"}]
+    client.get_paginator.assert_called_once_with("list_agents")
+    client.get_agent.assert_called_once_with(agentId="TEST-AGENT")
+    # The last page is never requested
+    assert len(list(client.get_paginator.return_value.paginate.return_value)) == 1
+
+
+def test_find_agent_no_match():
+    client = _paginated_agents(["agent-a"], ["agent-b"])
+
+    assert find_agent(client, _agent_module()) == []
+    client.get_agent.assert_not_called()
+
+
+# ----------------------
+# Tests for create_agent
+# ----------------------
+def test_create_agent_prepares_in_one_polling_loop(clock):
+    client = MagicMock()
+    client.create_agent.return_value = {"agent": {"agentId": "RNKFFDOKFN", "agentStatus": "CREATING"}}
+    client.get_agent.side_effect = [
+        {"agent": {"agentId": "RNKFFDOKFN", "agentStatus": s}}
+        for s in ("CREATING", "NOT_PREPARED", "NOT_PREPARED", "PREPARING", "PREPARED")
+    ]
+    module = _agent_module(tags=None)
+
+    changed, agent, msg = create_agent(module, client)
+
+    assert changed is True
+    assert agent == {"agentId": "RNKFFDOKFN", "agentStatus": "PREPARED"}
+    client.prepare_agent.assert_called_once_with(agentId="RNKFFDOKFN")
+    assert client.get_agent.call_count == 5
+
+
+def test_create_agent_params(clock):
+    client = MagicMock()
+    client.create_agent.return_value = {"agent": {"agentId": "RNKFFDOKFN", "agentStatus": "CREATING"}}
+    client.get_agent.return_value = {"agent": {"agentId": "RNKFFDOKFN", "agentStatus": "PREPARED"}}
+    module = _agent_module(
+        tags={"cost_center": "ai"},
+        prompt_override_configuration={
+            "prompt_configurations": [{"prompt_type": "ORCHESTRATION", "base_prompt_template": "template"}],
+            "override_lambda": None,
+        },
+    )
+
+    create_agent(module, client)
+
+    client.create_agent.assert_called_once_with(
+        agentName="test-agent",
+        tags={"cost_center": "ai"},
+        foundationModel="amazon.nova-micro-v1:0",
+        instruction="You are a friendly chat bot.",
+        agentResourceRoleArn="arn:aws:iam::123456789012:role/BedrockAgentRole",
+        orchestrationType="DEFAULT",
+        promptOverrideConfiguration={
+            "promptConfigurations": [{"promptType": "ORCHESTRATION", "basePromptTemplate": "template"}]
+        },
+    )
+
+
+# ----------------------
+# Tests for update_agent
+# ----------------------
+@pytest.mark.parametrize(
+    "params",
+    [
+        {},
+        {
+            "prompt_override_configuration": {
+                "prompt_configurations": [
+                    {
+                        "prompt_type": "ORCHESTRATION",
+                        "base_prompt_template": "template",
+                        "inference_configuration": None,
+                        "parser_mode": None,
+                        "prompt_creation_mode": "OVERRIDDEN",
+                        "prompt_state": None,
+                    }
+                ],
+                "override_lambda": None,
+            }
+        },
+    ],
+)
+def test_update_agent_no_changes(params):
+    client = MagicMock()
+    module = _agent_module(**params)
+
+    changed, agent, msg = update_agent(module, client, EXISTING_AGENT)
+
+    assert changed is False
+    assert agent is EXISTING_AGENT
+    assert msg == "No updates needed."
+    client.update_agent.assert_not_called()
+    client.prepare_agent.assert_not_called()
+
+
+def test_update_agent_prompt_override_subset():
+    # GetAgent reports every prompt type with its defaults, only the requested settings are compared
+    existing_agent = dict(EXISTING_AGENT)
+    existing_agent["promptOverrideConfiguration"] = {
+        "promptConfigurations": [
+            {"promptType": "PRE_PROCESSING", "promptCreationMode": "DEFAULT", "promptState": "DISABLED"},
+            {
+                "promptType": "ORCHESTRATION",
+                "basePromptTemplate": "template",
+                "promptCreationMode": "OVERRIDDEN",
+                "inferenceConfiguration": {"temperature": 0.0, "topP": 1.0, "maximumLength": 2048},
+            },
+        ]
+    }
+    client = MagicMock()
+    module = _agent_module(
+        prompt_override_configuration={
+            "prompt_configurations": [
+                {
+                    "prompt_type": "ORCHESTRATION",
+                    "base_prompt_template": "template",
+                    "inference_configuration": {"temperature": 0.0, "top_p": None},
+                }
+            ],
+            "override_lambda": None,
+        }
+    )
+
+    changed, agent, msg = update_agent(module, client, existing_agent)
+    assert changed is False
+
+    module.params["prompt_override_configuration"]["prompt_configurations"][0]["base_prompt_template"] = "new"
+    module.check_mode = True
+
+    changed, agent, msg = update_agent(module, client, existing_agent)
+    assert changed is True
+
+
+def test_update_agent_sends_camel_case_fields(clock):
+    client = MagicMock()
+    client.update_agent.return_value = {"agent": {"agentStatus": "NOT_PREPARED"}}
+    client.get_agent.return_value = {"agent": {"agentStatus": "PREPARED"}}
+    module = _agent_module(foundation_model="amazon.nova-lite-v1:0", instruction="A new instruction.")
+
+    changed, agent, msg = update_agent(module, client, EXISTING_AGENT)
+
+    assert changed is True
+    assert agent == {"agentStatus": "PREPARED"}
+    client.update_agent.assert_called_once_with(
+        agentId="RNKFFDOKFN",
+        agentName="test-agent",
+        foundationModel="amazon.nova-lite-v1:0",
+        instruction="A new instruction.",
+        agentResourceRoleArn="arn:aws:iam::123456789012:role/BedrockAgentRole",
+    )
+
+
+def test_update_agent_rename_prepares(clock):
+    client = MagicMock()
+    client.update_agent.return_value = {"agent": {"agentName": "renamed-agent", "agentStatus": "UPDATING"}}
+    client.get_agent.return_value = {"agent": {"agentName": "renamed-agent", "agentStatus": "PREPARED"}}
+    module = _agent_module(new_agent_name="renamed-agent")
+
+    changed, agent, msg = update_agent(module, client, EXISTING_AGENT)
+
+    assert changed is True
+    assert agent == {"agentName": "renamed-agent", "agentStatus": "PREPARED"}
+    client.prepare_agent.assert_called_once_with(agentId="RNKFFDOKFN")
+
+
+def test_update_agent_check_mode():
+    client = MagicMock()
+    module = _agent_module(check_mode=True, instruction="A new instruction.")
+
+    changed, agent, msg = update_agent(module, client, EXISTING_AGENT)
+
+    assert changed is True
+    assert agent is EXISTING_AGENT
+    client.update_agent.assert_not_called()
+
+
+# --------------------
+# Tests for find_alias
+# --------------------
+def test_find_alias_stops_paging_on_match():
+    client = MagicMock()
+    client.get_paginator.return_value.paginate.return_value = iter(
+        [
+            {"agentAliasSummaries": [{"agentAliasId": "AAAAAAAAAA", "agentAliasName": "other-alias"}]},
+            {"agentAliasSummaries": [{"agentAliasId": "Q8U5JCV5WI", "agentAliasName": "test-alias"}]},
+            {"agentAliasSummaries": [{"agentAliasId": "BBBBBBBBBB", "agentAliasName": "last-alias"}]},
+        ]
+    )
+
+    assert find_alias(client, "RNKFFDOKFN", "test-alias") == {
+        "agentAliasId": "Q8U5JCV5WI",
+        "agentAliasName": "test-alias",
+    }
+    client.get_paginator.assert_called_once_with("list_agent_aliases")
+    client.get_paginator.return_value.paginate.assert_called_once_with(agentId="RNKFFDOKFN")
+    # The last page is never requested
+    assert len(list(client.get_paginator.return_value.paginate.return_value)) == 1
+
+
+# ----------------------
+# Tests for create_alias
+# ----------------------
+def test_create_alias_returns_polled_alias(clock):
+    client = MagicMock()
+    client.create_agent_alias.return_value = {
+        "agentAlias": {"agentAliasId": "Q8U5JCV5WI", "agentAliasStatus": "CREATING"}
+    }
+    prepared = {"agentAliasId": "Q8U5JCV5WI", "agentAliasStatus": "PREPARED", "agentId": "RNKFFDOKFN"}
+    client.get_agent_alias.side_effect = [
+        {"agentAlias": {"agentAliasId": "Q8U5JCV5WI", "agentAliasStatus": "CREATING"}},
+        {"agentAlias": prepared},
+    ]
+    module = MagicMock(check_mode=False)
+    module.params = {"alias_name": "test-alias", "description": None, "tags": None, "routing_configuration": None}
+
+    changed, alias, msg = create_alias(client, module, "RNKFFDOKFN")
+
+    assert changed is True
+    assert alias == prepared
+    assert client.get_agent_alias.call_count == 2
+
+
+# ---------------------------
+# Tests for find_action_group
+# ---------------------------
+def test_find_action_group_describes_only_match():
+    client = MagicMock()
+    client.get_paginator.return_value.paginate.return_value = iter(
+        [
+            {"actionGroupSummaries": [{"actionGroupId": "AAAAAAAAAA", "actionGroupName": "other-action-group"}]},
+            {"actionGroupSummaries": [{"actionGroupId": "ABCDEFGHIJ", "actionGroupName": "test-action-group"}]},
+            {"actionGroupSummaries": [{"actionGroupId": "ZZZZZZZZZZ", "actionGroupName": "last-action-group"}]},
+        ]
+    )
+    client.get_agent_action_group.return_value = {"agentActionGroup": EXISTING_ACTION_GROUP}
+
+    assert find_action_group(client, "RNKFFDOKFN", "test-action-group", "DRAFT") is EXISTING_ACTION_GROUP
+    client.get_agent_action_group.assert_called_once_with(
+        agentId="RNKFFDOKFN", agentVersion="DRAFT", actionGroupId="ABCDEFGHIJ"
+    )
+    client.get_paginator.return_value.paginate.assert_called_once_with(agentId="RNKFFDOKFN", agentVersion="DRAFT")
+    # The last page is never requested
+    assert len(list(client.get_paginator.return_value.paginate.return_value)) == 1
+
+
+def test_find_action_group_summary_only():
+    client = MagicMock()
+    summary = {"actionGroupId": "ABCDEFGHIJ", "actionGroupName": "test-action-group"}
+    client.get_paginator.return_value.paginate.return_value = [{"actionGroupSummaries": [summary]}]
+
+    assert find_action_group(client, "RNKFFDOKFN", "test-action-group", "DRAFT", full=False) is summary
+    client.get_agent_action_group.assert_not_called()
+
+
+# -----------------------------
+# Tests for update_action_group
+# -----------------------------
+def test_update_action_group_equivalent_schema():
+    client = MagicMock()
+
+    changed, action_group, msg = update_action_group(
+        client, _action_group_module(), EXISTING_ACTION_GROUP, "RNKFFDOKFN"
+    )
+
+    assert changed is False
+    assert msg == "No updates needed."
+    client.update_agent_action_group.assert_not_called()
+
+
+def test_update_action_group_identical_schema_not_parsed(monkeypatch):
+    monkeypatch.setattr(yaml, "load", MagicMock(side_effect=AssertionError("schema was parsed")))
+    client = MagicMock()
+    module = _action_group_module(api_schema=EXISTING_ACTION_GROUP["apiSchema"]["payload"])
+
+    changed, action_group, msg = update_action_group(client, module, EXISTING_ACTION_GROUP, "RNKFFDOKFN")
+
+    assert changed is False
+
+
+def test_update_action_group_resends_unchanged_fields():
+    client = MagicMock()
+    client.update_agent_action_group.return_value = {"agentActionGroup": EXISTING_ACTION_GROUP}
+    module = _action_group_module(action_group_state="DISABLED")
+
+    changed, action_group, msg = update_action_group(client, module, EXISTING_ACTION_GROUP, "RNKFFDOKFN")
+
+    assert changed is True
+    client.update_agent_action_group.assert_called_once_with(
+        agentId="RNKFFDOKFN",
+        actionGroupId="ABCDEFGHIJ",
+        actionGroupState="DISABLED",
+        apiSchema=EXISTING_ACTION_GROUP["apiSchema"],
+        actionGroupName="test-action-group",
+        actionGroupExecutor=EXISTING_ACTION_GROUP["actionGroupExecutor"],
+        agentVersion="DRAFT",
+    )
+
+
+def test_update_action_group_changed_schema():
+    client = MagicMock()
+    module = _action_group_module(check_mode=True, api_schema="openapi: 3.0.0\npaths: {}\n")
+
+    changed, action_group, msg = update_action_group(client, module, EXISTING_ACTION_GROUP, "RNKFFDOKFN")
+
+    assert changed is True
+    client.update_agent_action_group.assert_not_called()
+
+
+# ------------------------------------
+# Tests for action_group_to_snake_dict
+# ------------------------------------
+def test_action_group_to_snake_dict_keeps_parameter_names():
+    action_group = {
+        "actionGroupId": "ABCDEFGHIJ",
+        "functionSchema": {
+            "functions": [
+                {
+                    "name": "getBooking",
+                    "requireConfirmation": "ENABLED",
+                    "parameters": {"bookingId": {"type": "string", "required": True, "description": "The ID."}},
+                }
+            ]
+        },
+    }
+
+    assert action_group_to_snake_dict(action_group) == {
+        "action_group_id": "ABCDEFGHIJ",
+        "function_schema": {
+            "functions": [
+                {
+                    "name": "getBooking",
+                    "require_confirmation": "ENABLED",
+                    "parameters": {"bookingId": {"type": "string", "required": True, "description": "The ID."}},
+                }
+            ]
+        },
+    }
+
+
+def test_action_group_to_snake_dict_without_function_schema():
+    assert action_group_to_snake_dict(EXISTING_ACTION_GROUP)["action_group_executor"] == {
+        "lambda": "arn:aws:lambda:us-east-1:123456789012:function:test"
+    }
@@ -3,6 +3,7 @@
 
 
 import json
+import threading
 from datetime import date
 from datetime import datetime
 from typing import Union
@@ -10,6 +11,7 @@ from typing import Union
 import pytest
 from ansible_collections.amazon.ai.plugins.module_utils.utils import convert_time_ranges
 from ansible_collections.amazon.ai.plugins.module_utils.utils import encode_body
+from ansible_collections.amazon.ai.plugins.module_utils.utils import map_concurrently
 from ansible_collections.amazon.ai.plugins.module_utils.utils import merge_data
 
 
@@ -185,3 +187,32 @@ def test_convert_time_ranges_edge_cases():
             assert to_time == expected_to
         else:
             assert to_time is None
+
+
+# --------------------------
+# Tests for map_concurrently
+# --------------------------
+@pytest.mark.parametrize("items", [[], [1], list(range(25))])
+def test_map_concurrently_preserves_order(items):
+    assert map_concurrently(lambda x: x * 2, items, max_workers=4) == [x * 2 for x in items]
+
+
+def test_map_concurrently_runs_in_parallel():
+    # Every call waits for the others, this only completes if all three run at once
+    barrier = threading.Barrier(3, timeout=5)
+
+    def wait(x):
+        barrier.wait()
+        return x
+
+    assert map_concurrently(wait, ["a", "b", "c"], max_workers=3) == ["a", "b", "c"]
+
+
+def test_map_concurrently_raises():
+    def fail_on_two(x):
+        if x == 2:
+            raise ValueError("boom")
+        return x
+
+    with pytest.raises(ValueError, match="boom"):
+        map_concurrently(fail_on_two, [1, 2, 3])